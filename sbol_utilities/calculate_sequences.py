@@ -116,7 +116,8 @@ def calculate_sequences(doc: sbol3.Document) -> List[sbol3.Sequence]:
     resolved = {c for c in dna_components if resolved_dna_component(c)}
     pending_resolution = {c for c in (dna_components-resolved)
                           if order_subcomponents(c) and not resolved_dna_component(c)}
-    logging.info(f'Found {len(dna_components)} DNA components, {len(pending_resolution)} needing sequences computed')
+    logging.info('Found %d DNA components, %d needing sequences computed',
+                 len(dna_components), len(pending_resolution))
 
     # loop through sequences, attempting to resolve each in turn
     while pending_resolution:
@@ -125,18 +126,18 @@ def calculate_sequences(doc: sbol3.Document) -> List[sbol3.Sequence]:
             break
         for c in resolvable:
             new_sequences.append(compute_sequence(c))
-            logging.info(f'Computed sequence for {c.display_id}')
+            logging.info('Computed sequence for %s', c.display_id)
         resolved = resolved.union(resolvable)
         pending_resolution -= resolvable
 
     if len(pending_resolution) == 0:
         logging.info('All sequences resolved')
     else:
-        logging.info(f'Could not resolve all sequences: {len(pending_resolution)} remain without a sequence')
+        logging.info('Could not resolve all sequences: %d remain without a sequence', len(pending_resolution))
 
     # Make sure the document is still OK, then return
     report = doc.validate()
-    logging.info(f'Document validation found {len(report.errors)} errors, {len(report.warnings)} warnings')
+    logging.info('Document validation found %d errors, %d warnings', len(report.errors), len(report.warnings))
     return new_sequences
 
 
@@ -21,6 +21,27 @@ from sbol_utilities.workarounds import id_sort
 # Used for conversion between SBOL2 and SBOL3
 SBOLGRAPH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'sbolgraph-standalone.js')
 
+# Remappings of SBOL2 and SBOL3 terms that the embedded converter does not translate, built once at import
+ENCODING_REMAPPING_2TO3 = {
+    sbol2.SBOL_ENCODING_IUPAC: sbol3.IUPAC_DNA_ENCODING,
+    sbol2.SBOL_ENCODING_IUPAC_PROTEIN: sbol3.IUPAC_PROTEIN_ENCODING,
+    sbol2.SBOL_ENCODING_SMILES: sbol3.SMILES_ENCODING
+}
+TYPE_REMAPPING_2TO3 = {
+    sbol2.BIOPAX_DNA: sbol3.SBO_DNA,
+    sbol2.BIOPAX_RNA: sbol3.SBO_RNA,
+    sbol2.BIOPAX_PROTEIN: sbol3.SBO_PROTEIN,
+    sbol2.BIOPAX_SMALL_MOLECULE: sbol3.SBO_SIMPLE_CHEMICAL,
+    sbol2.BIOPAX_COMPLEX: sbol3.SBO_NON_COVALENT_COMPLEX
+}
+ENCODING_REMAPPING_3TO2 = {v: k for k, v in ENCODING_REMAPPING_2TO3.items()}
+TYPE_REMAPPING_3TO2 = {v: k for k, v in TYPE_REMAPPING_2TO3.items()}
+ORIENTATION_REMAPPING_2TO3 = {
+    sbol2.SBOL_ORIENTATION_INLINE: sbol3.SBOL_INLINE,
+    sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT: sbol3.SBOL_REVERSE_COMPLEMENT
+}
+ORIENTATION_REMAPPING_3TO2 = {v: k for k, v in ORIENTATION_REMAPPING_2TO3.items()}
+
 
 def convert_identities2to3(sbol3_data: str) -> str:
     """Convert SBOL2 identities into SBOL3 identities.
@@ -34,14 +55,17 @@ def convert_identities2to3(sbol3_data: str) -> str:
     # TODO: remove workaround after conversion errors fixed in https://github.com/sboltools/sbolgraph/issues/14
     # for all objects in the prov namespace, add an SBOL type
     # TODO: likely need to do this for OM namespace too
+    child_prov_types = {sbol3.PROV_ASSOCIATION, sbol3.PROV_USAGE}
+    identified_type = rdflib.URIRef(sbol3.SBOL_IDENTIFIED)
+    top_level_type = rdflib.URIRef(sbol3.SBOL_TOP_LEVEL)
     for s, p, o in g.triples((None, rdflib.RDF.type, None)):
         if o.startswith(sbol3.PROV_NS):
-            if str(o) in {sbol3.PROV_ASSOCIATION, sbol3.PROV_USAGE}:
-                g.add((s, p, rdflib.URIRef(sbol3.SBOL_IDENTIFIED)))
+            if str(o) in child_prov_types:
+                g.add((s, p, identified_type))
             else:
-                g.add((s, p, rdflib.URIRef(sbol3.SBOL_TOP_LEVEL)))
+                g.add((s, p, top_level_type))
 
-    subjects = sorted(list(set(g.subjects())))
+    subjects = sorted(set(g.subjects()))
     for old_identity in subjects:
         # Check if the identity needs to change:
         new_identity = rdflib.URIRef(strip_sbol2_version(old_identity))
@@ -118,49 +142,41 @@ def convert2to3(sbol2_doc: Union[str, sbol2.Document], namespaces=None) -> sbol3
         p = urllib.parse.urlparse(o.identity)
         server = urllib.parse.urlunparse([p.scheme, p.netloc, '', '', '', ''])
         o.namespace = server
+    # collect Components and Sequences in a single pass, rather than rescanning doc.objects for each fix-up
+    components = []
+    sequences = []
+    for o in doc.objects:
+        if isinstance(o, sbol3.Component):
+            components.append(o)
+        elif isinstance(o, sbol3.Sequence):
+            sequences.append(o)
     # infer sequences for locations:
-    for s in (o for o in doc.objects if isinstance(o, sbol3.Component)):
+    for s in components:
         if len(s.sequences) != 1:  # can only infer sequences if there is precisely one
             continue
-        for f in (f for f in s.features if isinstance(f, sbol3.SequenceFeature) or isinstance(f, sbol3.SubComponent)):
+        sequence = s.sequences[0]
+        for f in (f for f in s.features if isinstance(f, (sbol3.SequenceFeature, sbol3.SubComponent))):
             for loc in f.locations:
-                loc.sequence = s.sequences[0]
+                loc.sequence = sequence
     # TODO: remove remap workarounds after conversions error fixed in https://github.com/sboltools/sbolgraph/issues/17
     # remap sequence encodings:
-    encoding_remapping = {
-        sbol2.SBOL_ENCODING_IUPAC: sbol3.IUPAC_DNA_ENCODING,
-        sbol2.SBOL_ENCODING_IUPAC_PROTEIN: sbol3.IUPAC_PROTEIN_ENCODING,
-        sbol2.SBOL_ENCODING_SMILES: sbol3.SMILES_ENCODING
-    }
-    for s in (o for o in doc.objects if isinstance(o, sbol3.Sequence)):
-        if s.encoding in encoding_remapping:
-            s.encoding = encoding_remapping[s.encoding]
+    for s in sequences:
+        if s.encoding in ENCODING_REMAPPING_2TO3:
+            s.encoding = ENCODING_REMAPPING_2TO3[s.encoding]
     # remap component types:
-    type_remapping = {
-        sbol2.BIOPAX_DNA: sbol3.SBO_DNA,
-        sbol2.BIOPAX_RNA: sbol3.SBO_RNA,
-        sbol2.BIOPAX_PROTEIN: sbol3.SBO_PROTEIN,
-        sbol2.BIOPAX_SMALL_MOLECULE: sbol3.SBO_SIMPLE_CHEMICAL,
-        sbol2.BIOPAX_COMPLEX: sbol3.SBO_NON_COVALENT_COMPLEX
-    }
-    for c in (o for o in doc.objects if isinstance(o, sbol3.Component)):
-        c.types = [(type_remapping[t] if t in type_remapping else t) for t in c.types]
+    for c in components:
+        c.types = [TYPE_REMAPPING_2TO3.get(t, t) for t in c.types]
 
     # remap orientation types
-    orientation_remapping = {
-        sbol2.SBOL_ORIENTATION_INLINE: sbol3.SBOL_INLINE,
-        sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT: sbol3.SBOL_REVERSE_COMPLEMENT
-    }
-
     def change_orientation(o):
         if isinstance(o, sbol3.Location):
-            if hasattr(o, 'orientation') and o.orientation in orientation_remapping:
-                o.orientation = orientation_remapping[o.orientation]
+            if hasattr(o, 'orientation') and o.orientation in ORIENTATION_REMAPPING_2TO3:
+                o.orientation = ORIENTATION_REMAPPING_2TO3[o.orientation]
     doc.traverse(change_orientation)
 
     report = doc.validate()
     if len(report):
-        report_string = "\n".join(str(e) for e in doc.validate())
+        report_string = "\n".join(str(e) for e in report)
         raise ValueError(f'Conversion from SBOL2 to SBOL3 produced an invalid document: {report_string}')
 
     return doc
@@ -173,36 +189,27 @@ def convert3to2(doc3: sbol3.Document) -> sbol2.Document:
     :return: equivalent SBOL2 document
     """
     # TODO: remove workarounds after conversion errors fixed in https://github.com/sboltools/sbolgraph/issues/16
+    # collect Components and Sequences in a single pass over the document
+    components = []
+    sequences = []
+    for o in doc3.objects:
+        if isinstance(o, sbol3.Component):
+            components.append(o)
+        elif isinstance(o, sbol3.Sequence):
+            sequences.append(o)
     # remap sequence encodings:
-    encoding_remapping = {
-        sbol3.IUPAC_DNA_ENCODING: sbol2.SBOL_ENCODING_IUPAC,
-        sbol3.IUPAC_PROTEIN_ENCODING: sbol2.SBOL_ENCODING_IUPAC_PROTEIN,
-        sbol3.SMILES_ENCODING: sbol2.SBOL_ENCODING_SMILES
-    }
-    for s in (o for o in doc3.objects if isinstance(o, sbol3.Sequence)):
-        if s.encoding in encoding_remapping:
-            s.encoding = encoding_remapping[s.encoding]
+    for s in sequences:
+        if s.encoding in ENCODING_REMAPPING_3TO2:
+            s.encoding = ENCODING_REMAPPING_3TO2[s.encoding]
     # remap component types:
-    type_remapping = {
-        sbol3.SBO_DNA: sbol2.BIOPAX_DNA,
-        sbol3.SBO_RNA: sbol2.BIOPAX_RNA,
-        sbol3.SBO_PROTEIN: sbol2.BIOPAX_PROTEIN,
-        sbol3.SBO_SIMPLE_CHEMICAL: sbol2.BIOPAX_SMALL_MOLECULE,
-        sbol3.SBO_NON_COVALENT_COMPLEX: sbol2.BIOPAX_COMPLEX
-    }
-    for c in (o for o in doc3.objects if isinstance(o, sbol3.Component)):
-        c.types = [(type_remapping[t] if t in type_remapping else t) for t in c.types]
+    for c in components:
+        c.types = [TYPE_REMAPPING_3TO2.get(t, t) for t in c.types]
 
     # remap orientation types
-    orientation_remapping = {
-        sbol3.SBOL_INLINE: sbol2.SBOL_ORIENTATION_INLINE,
-        sbol3.SBOL_REVERSE_COMPLEMENT: sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT
-    }
-
     def change_orientation(o):
-        if isinstance(o, sbol3.Location) or isinstance(o, sbol3.Feature):
-            if o.orientation in orientation_remapping:
-                o.orientation = orientation_remapping[o.orientation]
+        if isinstance(o, (sbol3.Location, sbol3.Feature)):
+            if o.orientation in ORIENTATION_REMAPPING_3TO2:
+                o.orientation = ORIENTATION_REMAPPING_3TO2[o.orientation]
     doc3.traverse(change_orientation)
 
     # Write to an RDF-XML temp file to run through the converter:
@@ -276,17 +283,20 @@ def convert_from_fasta(path: str, namespace: str, identity_map: Dict[str, str] =
     doc = sbol3.Document()
     with open(path, 'r') as f:
         for r in SeqIO.parse(f, 'fasta'):
-            if identity_map and r.id in identity_map:
-                identity = identity_map[r.id]
+            record_id = r.id
+            name = r.name
+            description = r.description.strip()
+            if identity_map and record_id in identity_map:
+                identity = identity_map[record_id]
                 # TODO: consider whether non-default remappings of namespaces will be useful
                 namespace_to_use = None  # if we got an identity directly, let the namespace be inferred
             else:
-                identity = f'{namespace}/{sbol3.string_to_display_id(r.id)}'
+                identity = f'{namespace}/{sbol3.string_to_display_id(record_id)}'
                 namespace_to_use = namespace
-            s = sbol3.Sequence(identity+'_sequence', name=r.name, description=r.description.strip(),
+            s = sbol3.Sequence(identity+'_sequence', name=name, description=description,
                                elements=str(r.seq), encoding=sbol3.IUPAC_DNA_ENCODING, namespace=namespace_to_use)
             doc.add(s)
-            doc.add(sbol3.Component(identity, sbol3.SBO_DNA, name=r.name, description=r.description.strip(),
+            doc.add(sbol3.Component(identity, sbol3.SBO_DNA, name=name, description=description,
                                     sequences=[s.identity], namespace=namespace_to_use))
     return doc
 
@@ -352,7 +362,7 @@ def convert_to_genbank(doc3: sbol3.Document, path: str, allow_genbank_online: bo
     # also sort the order of the feature qualifiers to ensure they remain stable
     for r in sorted_records:
         for f in r.features:
-            f.qualifiers = {k: f.qualifiers[k] for k in sorted(f.qualifiers)}
+            f.qualifiers = dict(sorted(f.qualifiers.items()))
 
     # write the final file
     SeqIO.write(sorted_records, path, 'gb')
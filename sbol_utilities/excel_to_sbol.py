@@ -138,7 +138,7 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
     try:  # look up with tyto; if fail, leave blank or add to description
         role = (tyto.SO.get_uri_by_term(raw_role) if raw_role else None)
     except LookupError:
-        logging.warning(f'Role "{raw_role}" could not be found in Sequence Ontology')
+        logging.warning('Role "%s" could not be found in Sequence Ontology', raw_role)
         role = None
     design_notes = (row[config['basic_notes_col']].value if row[config['basic_notes_col']].value else "")
     description = (row[config['basic_description_col']].value if row[config['basic_description_col']].value else "")
@@ -170,16 +170,16 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
                 was_derived_from = raw_url
                 namespace = identity.rsplit('/',1)[0]  # TODO: use a helper function
         else:
-            logging.info(f'Part "{name}" ignoring non-literal source: {source_prefix}')
+            logging.info('Part "%s" ignoring non-literal source: %s', name, source_prefix)
     elif source_id:
-        logging.warning(f'Part "{name}" has source ID specified but not prefix: {source_id}')
+        logging.warning('Part "%s" has source ID specified but not prefix: %s', name, source_id)
     elif source_prefix:
-        logging.warning(f'Part "{name}" has source prefix specified but not ID: {source_prefix}')
+        logging.warning('Part "%s" has source prefix specified but not ID: %s', name, source_prefix)
     if not identity:
         display_id = sbol3.string_to_display_id(name)
 
     # build a component from the material
-    logging.debug(f'Creating basic part "{name}"')
+    logging.debug('Creating basic part "%s"', name)
     component = sbol3.Component(identity or display_id, sbol3.SBO_DNA, name=name, namespace=namespace,
                                 description=f'{design_notes}\n{description}'.strip())
     if was_derived_from:
@@ -345,7 +345,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
     combinatorial = any(x for x in part_lists if len(x) > 1 or isinstance(x[0], sbol3.CombinatorialDerivation))
 
     # Build the composite
-    logging.debug(f'Creating {"library" if combinatorial else "composite part"} "{name}"')
+    logging.debug('Creating %s "%s"', "library" if combinatorial else "composite part", name)
     linear_dna_display_id = (f'{display_id}_ins' if backbone_or_locus else display_id)
     if combinatorial:
         composite_part = make_combinatorial_derivation(document, linear_dna_display_id, part_lists, reverse_complements,
@@ -373,7 +373,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
         if any(not is_plasmid(b) for b in backbones):
             raise ValueError(f'Specified backbones "{backbone_or_locus}" are not all plasmids')
         if combinatorial:
-            logging.debug(f"Embedding library '{composite_part.name}' in plasmid backbone(s) '{backbone_or_locus}'")
+            logging.debug("Embedding library '%s' in plasmid backbone(s) '%s'", composite_part.name, backbone_or_locus)
             plasmid = sbol3.Component(f'{display_id}_template', sbol3.SBO_DNA)
             document.add(plasmid)
             part_sub = sbol3.LocalSubComponent([sbol3.SBO_DNA], name="Inserted Construct")
@@ -387,7 +387,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
                 final_products.members.append(plasmid_cd)
         else:
             if len(backbones) == 1:
-                logging.debug(f'Embedding part "{composite_part.name}" in plasmid backbone "{backbone_or_locus}"')
+                logging.debug('Embedding part "%s" in plasmid backbone "%s"', composite_part.name, backbone_or_locus)
                 plasmid = sbol3.Component(display_id, sbol3.SBO_DNA, name=name)
                 document.add(plasmid)
                 part_sub = sbol3.SubComponent(composite_part)
@@ -395,7 +395,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
                 if final_product:
                     final_products.members += {plasmid}
             else:
-                logging.debug(f'Embedding part "{composite_part.name}" in plasmid library "{backbone_or_locus}"')
+                logging.debug('Embedding part "%s" in plasmid library "%s"', composite_part.name, backbone_or_locus)
                 plasmid = sbol3.Component(f'{display_id}_template', sbol3.SBO_DNA)
                 document.add(plasmid)
                 part_sub = sbol3.SubComponent(composite_part)
@@ -1,3 +1,4 @@
+import os
 import sbol3
 import graphviz
 import rdflib
@@ -163,7 +164,7 @@ def main():
     args_dict = vars(parser.parse_args())
     doc = sbol3.Document()
     doc.read(args_dict['in_file'])
-    outfile: str = args_dict['in_file'].split('.')[0]
+    outfile: str = os.path.splitext(args_dict['in_file'])[0]
     graph_sbol(doc, args_dict['file_format'], view_now=args_dict['view_now'], outfile=outfile,
                write_source=args_dict['write_source'])
 
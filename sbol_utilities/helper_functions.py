@@ -194,10 +194,10 @@ def strip_sbol2_version(identity: str) -> str:
     :param identity: URI to be sanitized
     :return: URI without terminal version, if any
     """
-    last_segment = identity.split('/')[-1]
+    prefix, separator, last_segment = identity.rpartition('/')
     try:
         _ = int(last_segment)  # if last segment is a number...
-        return identity.rsplit('/', 1)[0]  # ... then return everything else
+        return prefix if separator else identity  # ... then return everything else
     except ValueError:  # if last segment was not a number, there is no version to strip
         return identity
 
@@ -277,8 +277,8 @@ def is_plasmid(obj: Union[sbol3.Component, sbol3.Feature]) -> bool:
 
     if has_plasmid_role(obj):  # both components and features have roles that can indicate a plasmid type
         return True
-    elif isinstance(obj, sbol3.Component) or isinstance(obj, sbol3.LocalSubComponent) or \
-            isinstance(obj, sbol3.ExternallyDefined):  # if there's a type, check for circularity
+    elif isinstance(obj, (sbol3.Component, sbol3.LocalSubComponent, sbol3.ExternallyDefined)):
+        # if there's a type, check for circularity
         return sbol3.SO_CIRCULAR in obj.types
     elif isinstance(obj, sbol3.SubComponent):  # if it's a subcomponent, check its definition
         return is_plasmid(find_top_level(obj.instance_of))
@@ -44,7 +44,7 @@ setup(name='sbol-utilities',
             'sbol_factory>=1.0a11'
             ],
       extras_require={  # requirements for development
-          'dev': ['pytest', 'interrogate']
+          'dev': ['pytest', 'pytest-xdist', 'interrogate']
       },
       entry_points={
             'console_scripts': ['excel-to-sbol=sbol_utilities.excel_to_sbol:main',
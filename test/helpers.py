@@ -1,9 +1,15 @@
 import difflib
+import filecmp
 import tempfile
 import os
+from pathlib import Path
 from shutil import copy
 from typing import List, Dict
 
+from sbol_utilities.sbol_diff import file_diff
+
+TESTFILE_DIR = Path(__file__).parent / 'test_files'
+
 
 def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None) -> str:
     """Copy test files into a temporary package directory
@@ -21,11 +27,10 @@ def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None) -> st
     tmp_sub = os.path.join(tmp_dir, 'test_package')
     os.mkdir(tmp_sub)
     # copy all of the relevant files
-    test_dir = os.path.dirname(os.path.realpath(__file__))
     for f in package:
-        copy(os.path.join(test_dir, 'test_files', f), tmp_sub)
+        copy(TESTFILE_DIR / f, tmp_sub)
     for old_f, new_f in renames.items():
-        copy(os.path.join(test_dir, 'test_files', old_f), os.path.join(tmp_sub, new_f))
+        copy(TESTFILE_DIR / old_f, os.path.join(tmp_sub, new_f))
     return tmp_sub
 
 
@@ -41,3 +46,15 @@ def assert_files_identical(file1: os.PathLike, file2: os.PathLike) -> None:
     diff_str = ''.join(diff)
     if diff_str:
         raise AssertionError("File differs from expected value:\n" + diff_str)
+
+
+def assert_rdf_files_equivalent(file1: os.PathLike, file2: os.PathLike) -> None:
+    """check if two RDF files hold the same graph; if not, report the differing triples
+    Byte-identical files are accepted without parsing, which is the common case for golden-file comparisons
+    :param file1: path of first file to compare
+    :param file2: path of second file to compare
+    """
+    if filecmp.cmp(file1, file2, shallow=False):
+        return
+    if file_diff(str(file1), str(file2)):
+        raise AssertionError(f'RDF graph in {file1} differs from graph in {file2}')
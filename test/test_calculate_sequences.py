@@ -1,4 +1,3 @@
-import filecmp
 import sys
 import tempfile
 import unittest
@@ -11,19 +10,23 @@ import sbol3
 import sbol_utilities.calculate_sequences
 from sbol_utilities.excel_to_sbol import excel_to_sbol
 from sbol_utilities.expand_combinatorial_derivations import expand_derivations
+from helpers import assert_files_identical, TESTFILE_DIR
 
 
 class TestCalculateSequences(unittest.TestCase):
     def test_calculate_sequences(self):
         """Test inference of sequences"""
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         doc = sbol3.Document()
-        doc.read(os.path.join(test_dir, 'test_files', 'expanded_simple_library.nt'))
+        doc.read(str(TESTFILE_DIR / 'expanded_simple_library.nt'))
         prior_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
-        tmp_out = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
+        # make sure that what came out is exactly what was expected
+        comparison_file = TESTFILE_DIR / 'expanded_with_sequences.nt'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_out = os.path.join(tmpdir, 'out.nt')
+            doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
+            assert_files_identical(tmp_out, comparison_file)
 
         # check to see if all of the expected sequences have been filled in as anticipated
         # total number of new sequences should be: 20
@@ -42,16 +45,11 @@ class TestCalculateSequences(unittest.TestCase):
         self.assertTrue(not new_seqs and sequence_count == second_sequence_count,
                         f'Unexpected new sequences {new_seqs}')
 
-        # make sure that what came out is exactly what was expected
-        comparison_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
-        assert filecmp.cmp(tmp_out, comparison_file), f'Converted file {tmp_out} is not identical'
-
     def test_circular_calculation(self):
         """Test sequence inference on two different types of circular builds plasmids;
         one fully marked, one partly"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         # prep the document
-        wb_name = os.path.join(test_dir, 'test_files', 'circular_inference_test.xlsx')
+        wb_name = str(TESTFILE_DIR / 'circular_inference_test.xlsx')
         wb = openpyxl.load_workbook(wb_name, data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = excel_to_sbol(wb)
@@ -65,8 +63,12 @@ class TestCalculateSequences(unittest.TestCase):
 
         prior_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
-        tmp_out = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
+        # make sure that what came out is exactly what was expected
+        comparison_file = TESTFILE_DIR / 'circular_sequence_inference.nt'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_out = os.path.join(tmpdir, 'out.nt')
+            doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
+            assert_files_identical(tmp_out, comparison_file)
 
         # check to see if all of the expected sequences have been filled in as anticipated
         # total number of new sequences should be: 10
@@ -90,19 +92,16 @@ class TestCalculateSequences(unittest.TestCase):
         second_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         assert not new_seqs and sequence_count == second_sequence_count, f'Unexpected new sequences {new_seqs}'
 
-        # make sure that what came out is exactly what was expected
-        comparison_file = os.path.join(test_dir, 'test_files', 'circular_sequence_inference.nt')
-        assert filecmp.cmp(tmp_out, comparison_file), f'Converted file {tmp_out} is not identical'
-
     def test_commandline(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        test_args = ['sbol-calculate-sequences', '-vv',
-                     os.path.join(test_dir, 'test_files', 'expanded_simple_library.nt'), '-o', temp_name]
-        with patch.object(sys, 'argv', test_args):
-            sbol_utilities.calculate_sequences.main()
-        comparison_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
-        assert filecmp.cmp(temp_name, comparison_file), f'Converted file {temp_name} is not identical'
+        sbol3.set_namespace('http://sbolstandard.org/testfiles')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            test_args = ['sbol-calculate-sequences', '-vv',
+                         str(TESTFILE_DIR / 'expanded_simple_library.nt'), '-o', temp_name]
+            with patch.object(sys, 'argv', test_args):
+                sbol_utilities.calculate_sequences.main()
+            comparison_file = TESTFILE_DIR / 'expanded_with_sequences.nt'
+            assert_files_identical(temp_name, comparison_file)
 
 if __name__ == '__main__':
     unittest.main()
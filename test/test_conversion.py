@@ -12,7 +12,7 @@ import sbol3
 from sbol_utilities.conversion import convert2to3, convert3to2, convert_to_genbank, convert_to_fasta, \
     convert_from_fasta, convert_from_genbank, \
     main, sbol2fasta, sbol2genbank, sbol2to3, sbol3to2, fasta2sbol, genbank2sbol
-from helpers import copy_to_tmp
+from helpers import copy_to_tmp, TESTFILE_DIR
 from sbol_utilities.sbol_diff import doc_diff
 # TODO: Add command-line utilities and test them too
 
@@ -20,8 +20,7 @@ from sbol_utilities.sbol_diff import doc_diff
 class Test2To3Conversion(unittest.TestCase):
     def test_convert_identities(self):
         """Test conversion of a complex file"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        input_path = os.path.join(test_dir, 'test_files', 'sbol3-small-molecule.rdf')
+        input_path = str(TESTFILE_DIR / 'sbol3-small-molecule.rdf')
         doc = convert2to3(input_path)
         # check for issues in converted document
         report = doc.validate()
@@ -31,8 +30,7 @@ class Test2To3Conversion(unittest.TestCase):
 
     def test_convert_object(self):
         """Test conversion of a loaded SBOL2 document"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        input_path = os.path.join(test_dir, 'test_files', 'sbol3-small-molecule.rdf')
+        input_path = str(TESTFILE_DIR / 'sbol3-small-molecule.rdf')
         doc2 = sbol2.Document()
         doc2.read(input_path)
         doc = convert2to3(doc2)
@@ -89,8 +87,7 @@ class Test2To3Conversion(unittest.TestCase):
         doc3.write(outfile)
 
         # check round trip
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'constraints_library.nt')
+        comparison_file = TESTFILE_DIR / 'constraints_library.nt'
         assert filecmp.cmp(outfile, comparison_file), f'Round-tripped file {outfile} is not identical'
 
     def test_3to2_orientation_conversion(self):
@@ -129,7 +126,7 @@ class Test2To3Conversion(unittest.TestCase):
 
         # also check the feeature orientations are getting converted
         doc3 = sbol3.Document()
-        doc3.read('test/test_files/feature_orientation_conversion.nt')
+        doc3.read(os.path.join(tmp_sub, 'feature_orientation_conversion.nt'))
         # Convert to SBOL2 and check contents
         doc2 = convert3to2(doc3)
         try:
@@ -149,8 +146,7 @@ class Test2To3Conversion(unittest.TestCase):
         outfile = os.path.join(tmp_sub, 'BBa_J23101.gb')
         convert_to_genbank(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101.gb')
+        comparison_file = TESTFILE_DIR / 'BBa_J23101.gb'
         assert filecmp.cmp(outfile, comparison_file), f'Converted GenBank file {comparison_file} is not identical'
 
     def test_conversion_from_genbank(self):
@@ -160,8 +156,7 @@ class Test2To3Conversion(unittest.TestCase):
         doc3 = convert_from_genbank(os.path.join(tmp_sub, 'BBa_J23101.gb'), 'https://synbiohub.org/public/igem')
 
         # Note: cannot directly round-trip because converter is a) lossy, and b) inserts extra materials
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_genbank.nt')
+        comparison_file = str(TESTFILE_DIR / 'BBa_J23101_from_genbank.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted GenBank file not identical to {comparison_file}'
@@ -177,8 +172,7 @@ class Test2To3Conversion(unittest.TestCase):
         outfile = os.path.join(tmp_sub, 'iGEM_SBOL2_imports.gb')
         convert_to_genbank(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'iGEM_SBOL2_imports.gb')
+        comparison_file = TESTFILE_DIR / 'iGEM_SBOL2_imports.gb'
         assert filecmp.cmp(outfile, comparison_file), f'Converted GenBank file {comparison_file} is not identical'
 
     def test_fasta_conversion(self):
@@ -192,8 +186,7 @@ class Test2To3Conversion(unittest.TestCase):
         outfile = os.path.join(tmp_sub, 'BBa_J23101.fasta')
         convert_to_fasta(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101.fasta')
+        comparison_file = TESTFILE_DIR / 'BBa_J23101.fasta'
         assert filecmp.cmp(outfile, comparison_file), f'Converted FASTA file {comparison_file} is not identical'
 
     def test_conversion_from_fasta(self):
@@ -204,8 +197,7 @@ class Test2To3Conversion(unittest.TestCase):
         doc3 = convert_from_fasta(os.path.join(tmp_sub, 'BBa_J23101.fasta'), 'https://synbiohub.org/public/igem')
 
         # Note: cannot directly round-trip because converter is lossy
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_fasta.nt')
+        comparison_file = str(TESTFILE_DIR / 'BBa_J23101_from_fasta.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted FASTA file not identical to {comparison_file}'
@@ -219,82 +211,83 @@ class Test2To3Conversion(unittest.TestCase):
                                   identity_map={'BBa_J23101': 'https://somewhere_else.org/public/igem/BBa_J23101'})
 
         # Note: cannot directly round-trip because converter is lossy
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_fasta_altname.nt')
+        comparison_file = str(TESTFILE_DIR / 'BBa_J23101_from_fasta_altname.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted FASTA file not identical to {comparison_file}'
 
     def test_commandline(self):
-        test_files = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
-        temp_name = tempfile.mkstemp()[1]
-        test_file = {
-            'fasta': os.path.join(test_files, 'BBa_J23101.fasta'),
-            'genbank': os.path.join(test_files, 'BBa_J23101.gb'),
-            'from_fasta': os.path.join(test_files, 'BBa_J23101_from_fasta.nt'),
-            'from_genbank': os.path.join(test_files, 'BBa_J23101_from_genbank.nt'),
-            'sbol3': os.path.join(test_files, 'BBa_J23101.nt'),
-            'sbol323': os.path.join(test_files, 'BBa_J23101_3to2to3.nt')
-        }
-
-        # Run the generic command-line converter with a couple of different configurations:
-        test_args = ['sbol-converter', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', 'FASTA', 'SBOL3',
-                     test_file['fasta']]
-        with patch.object(sys, 'argv', test_args):
-            main()
-        assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
-
-        test_args = ['sbol-converter', '-o', temp_name, 'SBOL3', 'SBOL3', test_file['sbol3']]
-        with patch.object(sys, 'argv', test_args):
-            main()
-        assert filecmp.cmp(temp_name, test_file['sbol3']), f'Converted file {temp_name} is not identical'
-
-        # Run the other six tests
-        test_args = ['fasta-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['fasta']]
-        with patch.object(sys, 'argv', test_args):
-            fasta2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
-
-        # genbank conversion should succeed the same way when not online if not given an online argument
-        test_args = ['genbank-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['genbank']]
-        with patch.object(sys, 'argv', test_args):
-            genbank2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
-
-        test_args = ['sbol-to-fasta', '-o', temp_name, test_file['sbol3']]
-        with patch.object(sys, 'argv', test_args):
-            sbol2fasta()
-        assert filecmp.cmp(temp_name, test_file['fasta']), f'Converted file {temp_name} is not identical'
-
-        test_args = ['sbol-to-genbank', '-o', temp_name, test_file['sbol3']]
-        with patch.object(sys, 'argv', test_args):
-            sbol2genbank()
-        assert filecmp.cmp(temp_name, test_file['genbank']), f'Converted file {temp_name} is not identical'
-
-        # SBOL2 serialization is not stable, so test via round-trip instead
-        test_args = ['sbol3-to-sbol2', '-o', temp_name, test_file['sbol3']]
-        with patch.object(sys, 'argv', test_args):
-            sbol3to2()
-        temp_name_2 = tempfile.mkstemp()[1]
-        test_args = ['sbol2-to-sbol3', '-o', temp_name_2, temp_name]
-        with patch.object(sys, 'argv', test_args):
-            sbol2to3()
-        assert filecmp.cmp(temp_name_2, test_file['sbol323']), f'Converted file {temp_name} is not identical'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out')
+            test_file = {
+                'fasta': str(TESTFILE_DIR / 'BBa_J23101.fasta'),
+                'genbank': str(TESTFILE_DIR / 'BBa_J23101.gb'),
+                'from_fasta': str(TESTFILE_DIR / 'BBa_J23101_from_fasta.nt'),
+                'from_genbank': str(TESTFILE_DIR / 'BBa_J23101_from_genbank.nt'),
+                'sbol3': str(TESTFILE_DIR / 'BBa_J23101.nt'),
+                'sbol323': str(TESTFILE_DIR / 'BBa_J23101_3to2to3.nt')
+            }
+
+            # Run the generic command-line converter with a couple of different configurations:
+            test_args = ['sbol-converter', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem',
+                         'FASTA', 'SBOL3', test_file['fasta']]
+            with patch.object(sys, 'argv', test_args):
+                main()
+            assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
+
+            test_args = ['sbol-converter', '-o', temp_name, 'SBOL3', 'SBOL3', test_file['sbol3']]
+            with patch.object(sys, 'argv', test_args):
+                main()
+            assert filecmp.cmp(temp_name, test_file['sbol3']), f'Converted file {temp_name} is not identical'
+
+            # Run the other six tests
+            test_args = ['fasta-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem',
+                         test_file['fasta']]
+            with patch.object(sys, 'argv', test_args):
+                fasta2sbol()
+            assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
+
+            # genbank conversion should succeed the same way when not online if not given an online argument
+            test_args = ['genbank-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem',
+                         test_file['genbank']]
+            with patch.object(sys, 'argv', test_args):
+                genbank2sbol()
+            assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
+
+            test_args = ['sbol-to-fasta', '-o', temp_name, test_file['sbol3']]
+            with patch.object(sys, 'argv', test_args):
+                sbol2fasta()
+            assert filecmp.cmp(temp_name, test_file['fasta']), f'Converted file {temp_name} is not identical'
+
+            test_args = ['sbol-to-genbank', '-o', temp_name, test_file['sbol3']]
+            with patch.object(sys, 'argv', test_args):
+                sbol2genbank()
+            assert filecmp.cmp(temp_name, test_file['genbank']), f'Converted file {temp_name} is not identical'
+
+            # SBOL2 serialization is not stable, so test via round-trip instead
+            test_args = ['sbol3-to-sbol2', '-o', temp_name, test_file['sbol3']]
+            with patch.object(sys, 'argv', test_args):
+                sbol3to2()
+            temp_name_2 = os.path.join(tmpdir, 'out_2')
+            test_args = ['sbol2-to-sbol3', '-o', temp_name_2, temp_name]
+            with patch.object(sys, 'argv', test_args):
+                sbol2to3()
+            assert filecmp.cmp(temp_name_2, test_file['sbol323']), f'Converted file {temp_name} is not identical'
 
     def test_online_conversion(self):
         """Test whether we are able to use the online converter"""
-        test_files = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
-        temp_name = tempfile.mkstemp()[1]
-        test_file = {
-            'genbank': os.path.join(test_files, 'BBa_J23101.gb'),
-            'from_genbank': os.path.join(test_files, 'BBa_J23101_from_genbank.nt'),
-        }
-
-        test_args = ['genbank-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['genbank'],
-                     '--allow-genbank-online']
-        with patch.object(sys, 'argv', test_args):
-            genbank2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out')
+            test_file = {
+                'genbank': str(TESTFILE_DIR / 'BBa_J23101.gb'),
+                'from_genbank': str(TESTFILE_DIR / 'BBa_J23101_from_genbank.nt'),
+            }
+
+            test_args = ['genbank-to-sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem',
+                         test_file['genbank'], '--allow-genbank-online']
+            with patch.object(sys, 'argv', test_args):
+                genbank2sbol()
+            assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
 
 
 if __name__ == '__main__':
@@ -9,9 +9,7 @@ import logging
 import sys
 from unittest.mock import patch
 
-from sbol_utilities import sbol_diff
-
-TESTFILE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
+from helpers import assert_rdf_files_equivalent, TESTFILE_DIR
 
 logging.getLogger().setLevel(level=logging.DEBUG)
 
@@ -19,23 +17,25 @@ logging.getLogger().setLevel(level=logging.DEBUG)
 class TestExcel2SBOL(unittest.TestCase):
     def test_conversion(self):
         """Basic smoke test of Excel to SBOL3 conversion"""
-        wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'simple_library.xlsx'), data_only=True)
+        wb = openpyxl.load_workbook(str(TESTFILE_DIR / 'simple_library.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert not report.errors and not report.warnings
         assert len(doc.find('BasicParts').members) == 26
         assert len(doc.find('CompositeParts').members) == 6
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            doc.write(temp_name, sbol3.SORTED_NTRIPLES)
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'simple_library.nt')
 
     def test_custom_conversion(self):
         """Test if conversion works correctly when the config us used to change expected sheet structure"""
-        wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'nonstandard_simple_library.xlsx'), data_only=True)
+        wb = openpyxl.load_workbook(str(TESTFILE_DIR / 'nonstandard_simple_library.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         config = {
             'basic_parts_name': 'C2',
@@ -54,55 +54,62 @@ class TestExcel2SBOL(unittest.TestCase):
         }
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb, config)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert not report.errors and not report.warnings
         assert len(doc.find('BasicParts').members) == 26
         assert len(doc.find('CompositeParts').members) == 6
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            doc.write(temp_name, sbol3.SORTED_NTRIPLES)
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'simple_library.nt')
 
     def test_multi_backbone(self):
         """Check if generation works correctly when there is more than one backbone option"""
-        wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'two_backbones.xlsx'), data_only=True)
+        wb = openpyxl.load_workbook(str(TESTFILE_DIR / 'two_backbones.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert not report.errors and not report.warnings
         assert len(doc.find('BasicParts').members) == 9
         assert len(doc.find('CompositeParts').members) == 2
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'two_backbones.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            doc.write(temp_name, sbol3.SORTED_NTRIPLES)
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'two_backbones.nt')
 
     def test_constraints(self):
         """Check if constraints are generated correctly"""
-        wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'constraints_library.xlsx'), data_only=True)
+        wb = openpyxl.load_workbook(str(TESTFILE_DIR / 'constraints_library.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert not report.errors and not report.warnings
         assert len(doc.find('BasicParts').members) == 43
         assert len(doc.find('CompositeParts').members) == 8
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'constraints_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            doc.write(temp_name, sbol3.SORTED_NTRIPLES)
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'constraints_library.nt')
 
     def test_commandline(self):
         """Make sure function works correctly when run from the command line"""
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        test_args = ['excel-to-sbol', '-vv', os.path.join(TESTFILE_DIR, 'simple_library.xlsx'), '-o', temp_name, '-n',
-                     'http://sbolstandard.org/testfiles']
-        with patch.object(sys, 'argv', test_args):
-            sbol_utilities.excel_to_sbol.main()
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            test_args = ['excel-to-sbol', '-vv', str(TESTFILE_DIR / 'simple_library.xlsx'), '-o', temp_name,
+                         '-n', 'http://sbolstandard.org/testfiles']
+            with patch.object(sys, 'argv', test_args):
+                sbol_utilities.excel_to_sbol.main()
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'simple_library.nt')
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,14 +7,11 @@ import os
 import logging
 import sys
 from unittest.mock import patch
-from pathlib import Path
 
-from sbol_utilities.sbol_diff import file_diff
 from sbol_utilities.workarounds import copy_toplevel_and_dependencies
 from sbol_utilities.expand_combinatorial_derivations import root_combinatorial_derivations, \
     expand_derivations
-
-TESTFILE_DIR = Path(__file__).parent / 'test_files'
+from helpers import assert_rdf_files_equivalent, TESTFILE_DIR
 
 logging.getLogger().setLevel(level=logging.DEBUG)
 
@@ -24,7 +21,7 @@ class TestCDExpansion(unittest.TestCase):
     def test_expansion(self):
         """Test basic expansion of combinatorial derivations"""
         doc = sbol3.Document()
-        doc.read(os.path.join(TESTFILE_DIR, 'simple_library.nt'))
+        doc.read(str(TESTFILE_DIR / 'simple_library.nt'))
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         roots = list(root_combinatorial_derivations(doc))
         assert len(roots) == 1, f'Unexpected roots: {[r.identity for r in roots]}'
@@ -37,23 +34,47 @@ class TestCDExpansion(unittest.TestCase):
             copy_toplevel_and_dependencies(output_doc, c)
         assert not len(output_doc.validate())
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        output_doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(file_diff(temp_name, str(TESTFILE_DIR / 'expanded_simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            output_doc.write(temp_name, sbol3.SORTED_NTRIPLES)
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'expanded_simple_library.nt')
 
     def test_multi_backbone(self):
         """Test expansion of a specification with multiple backbones"""
         doc = sbol3.Document()
-        doc.read(os.path.join(TESTFILE_DIR, 'two_backbones.nt'))
+        doc.read(str(TESTFILE_DIR / 'two_backbones.nt'))
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         roots = list(root_combinatorial_derivations(doc))
         assert len(roots) == 2
         expand_derivations(roots)
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert not report.errors and not report.warnings
         assert len(doc.find('Two_by_six_ins_collection').members) == 6
         assert len(doc.find('Two_by_six_derivatives').members) == 12
         assert len(doc.find('Backbone_variants_derivatives').members) == 2
 
+    def test_nested_variant_collections(self):
+        """Test expansion of a variable whose variant collection contains other collections"""
+        sbol3.set_namespace('http://sbolstandard.org/testfiles')
+        doc = sbol3.Document()
+        parts = [sbol3.Component(f'part_{i}', sbol3.SBO_DNA) for i in range(3)]
+        inner_1 = sbol3.Collection('inner_1', members=parts[:2])
+        inner_2 = sbol3.Collection('inner_2', members=parts[2:])
+        outer = sbol3.Collection('outer', members=[inner_1, inner_2])
+        template = sbol3.Component('nested_template', sbol3.SBO_DNA)
+        slot = sbol3.SubComponent(parts[0])
+        template.features.append(slot)
+        cd = sbol3.CombinatorialDerivation('nested_cd', template)
+        cd.variable_features.append(sbol3.VariableFeature(cardinality=sbol3.SBOL_ONE, variable=slot,
+                                                          variant_collections=[outer]))
+        doc.add(parts + [inner_1, inner_2, outer, template, cd])
+
+        derivative_collections = expand_derivations([cd])
+        report = doc.validate()
+        assert not report.errors and not report.warnings
+        self.assertEqual(len(derivative_collections), 1)
+        self.assertEqual(sorted(str(m) for m in derivative_collections[0].members), sorted(p.identity for p in parts))
+
     #def test_constraints():  # TODO: to be added when constraint-handling is incorporated.
         # wb = openpyxl.load_workbook(TESTFILE_DIR + '/constraints_library.nt', data_only=True)
         # sbol3.set_namespace('http://sbolstandard.org/testfiles')
@@ -71,12 +92,13 @@ class TestCDExpansion(unittest.TestCase):
 
     def test_commandline(self):
         """Test expansion of combinatorial derivations from command line"""
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        test_args = ['sbol-expand-derivations', '-vv', str(TESTFILE_DIR / 'simple_library.nt'),
-                     '-o', temp_name]
-        with patch.object(sys, 'argv', test_args):
-            sbol_utilities.expand_combinatorial_derivations.main()
-        self.assertFalse(file_diff(temp_name, str(TESTFILE_DIR / 'expanded_simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_name = os.path.join(tmpdir, 'out.nt')
+            test_args = ['sbol-expand-derivations', '-vv', str(TESTFILE_DIR / 'simple_library.nt'),
+                         '-o', temp_name]
+            with patch.object(sys, 'argv', test_args):
+                sbol_utilities.expand_combinatorial_derivations.main()
+            assert_rdf_files_equivalent(temp_name, TESTFILE_DIR / 'expanded_simple_library.nt')
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,10 +6,7 @@ import unittest
 import sbol3
 from sbol_utilities.graph_sbol import graph_sbol
 
-from helpers import assert_files_identical
-
-# Path to load SBOL files from
-TESTFILE_DIR = Path(__file__).parent / 'test_files'
+from helpers import assert_files_identical, TESTFILE_DIR
 
 
 class GraphSbol(unittest.TestCase):
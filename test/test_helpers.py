@@ -1,10 +1,9 @@
 import unittest
-import os
-from pathlib import Path
 
 from sbol_utilities import component
 
 from sbol_utilities.helper_functions import *
+from helpers import TESTFILE_DIR
 
 
 class TestHelpers(unittest.TestCase):
@@ -33,10 +32,9 @@ class TestHelpers(unittest.TestCase):
 
     def test_filtering_top_level_objects(self):
         """Check filtering Top Level Objects by a condition"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         # we consider simple_library document for the test
-        simple_library = os.path.join(test_dir, 'test_files', 'simple_library.nt')
+        simple_library = str(TESTFILE_DIR / 'simple_library.nt')
         doc = sbol3.Document()
         doc.read(simple_library)
 
@@ -47,8 +45,7 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(total_filtered, 24, f'Expected 24 Objects to satisfy filter, found {total_filtered}')
 
     def test_build_reference_cache(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        test_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
+        test_file = str(TESTFILE_DIR / 'expanded_with_sequences.nt')
         doc = sbol3.Document()
         doc.read(test_file)
         cache = build_reference_cache(doc)
@@ -78,8 +75,7 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(sequence, found_object)
 
     def test_with_cached_references(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        test_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
+        test_file = str(TESTFILE_DIR / 'expanded_with_sequences.nt')
         doc = sbol3.Document()
         doc.read(test_file)
         target_uri = 'http://sbolstandard.org/testfiles/mmilCFP'
@@ -121,8 +117,7 @@ class TestHelpers(unittest.TestCase):
     def test_outgoing(self):
         """Test the outgoing_links function"""
         doc = sbol3.Document()
-        test_dir = Path(__file__).parent
-        doc.read(str(test_dir / 'test_files' / 'incomplete_constraints_library.nt'))
+        doc.read(str(TESTFILE_DIR / 'incomplete_constraints_library.nt'))
 
         expected = {'http://parts.igem.org/E0040',
                     'http://parts.igem.org/J23105_sequence',
@@ -1,16 +1,18 @@
+import filecmp
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
 import sbol3
 
 import sbol_utilities.sbol_diff
+from helpers import TESTFILE_DIR
 
-TEST_DIR = os.path.dirname(os.path.realpath(__file__))
-TEST_FILES_DIR = os.path.join(TEST_DIR, 'test_files')
-SL_SBOL_PATH = os.path.join(TEST_FILES_DIR, 'simple_library.nt')
-ESL_SBOL_PATH = os.path.join(TEST_FILES_DIR, 'expanded_simple_library.nt')
+SL_SBOL_PATH = str(TESTFILE_DIR / 'simple_library.nt')
+ESL_SBOL_PATH = str(TESTFILE_DIR / 'expanded_simple_library.nt')
 
 
 class TestSbolDiff(unittest.TestCase):
@@ -38,6 +40,25 @@ class TestSbolDiff(unittest.TestCase):
         expected = 1
         self.assertEqual(expected, actual)
 
+    def test_file_diff_identical_copy(self):
+        """A byte-identical copy in another location is reported as the same"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            copy_path = os.path.join(tmpdir, 'copy.nt')
+            shutil.copy(ESL_SBOL_PATH, copy_path)
+            actual = sbol_utilities.sbol_diff.file_diff(ESL_SBOL_PATH, copy_path, silent=True)
+        self.assertEqual(0, actual)
+
+    def test_file_diff_reserialized(self):
+        """The same graph serialized with different bytes is reported as the same"""
+        doc = sbol3.Document()
+        doc.read(ESL_SBOL_PATH)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reserialized_path = os.path.join(tmpdir, 'reserialized.ttl')
+            doc.write(reserialized_path, sbol3.TURTLE)
+            self.assertFalse(filecmp.cmp(ESL_SBOL_PATH, reserialized_path, shallow=False))
+            actual = sbol_utilities.sbol_diff.file_diff(ESL_SBOL_PATH, reserialized_path, silent=True)
+        self.assertEqual(0, actual)
+
     def test_doc_diff(self):
         """Invoke sbol_utilities.sbol_diff.doc_diff directly"""
         esl_doc = sbol3.Document()